@@ -8,11 +8,14 @@ Integrated module for the Unified Security Tools Suite.
 Detects Apple AirTags using Bluetooth Low Energy (BLE) scanning.
 """
 
+import array
 import asyncio
+import heapq
 import time
 import threading
-from datetime import datetime, timedelta, timezone
-from typing import Dict, Optional, Tuple
+from collections import deque
+from operator import attrgetter
+from typing import Dict, List, Optional, Tuple
 from dataclasses import dataclass
 import sys
 import os
@@ -33,16 +36,112 @@ except ImportError as e:
     RICH_AVAILABLE = False
 
 
+# Effective UID is fixed for the process; os.geteuid() does not exist on Windows
+IS_ROOT = hasattr(os, 'geteuid') and os.geteuid() == 0
+
+# Clear screen and move the cursor home (replaces spawning `clear`)
+ANSI_CLEAR_SCREEN = "\x1b[2J\x1b[H"
+
+# Apple Bluetooth SIG company identifier (0x004C)
+APPLE_CID = 76
+
+# AirTag payload prefixes: registered (FindMy) 0x12 0x19 0x10,
+# unregistered 0x07 0x19
+_PREFIX_REGISTERED = b'\x12\x19\x10'
+_PREFIX_UNREGISTERED = b'\x07\x19'
+
+# Sort key for devices (C-level attribute getter instead of a lambda)
+_BY_RSSI = attrgetter('rssi')
+
+# Number of RSSI readings kept per device for trend smoothing
+RSSI_HISTORY = 8
+
+
+def _clamp_rssi(rssi: int) -> int:
+    """Clamp RSSI into the signed byte range used by the history buffer"""
+    return max(-128, min(127, rssi))
+
+
+def _check_registered(apple_data: bytes) -> bool:
+    """Registered AirTag (FindMy): type 0x12, length 0x19, status byte 0x10"""
+    return len(apple_data) >= 4 and apple_data.startswith(_PREFIX_REGISTERED)
+
+
+def _check_unregistered(apple_data: bytes) -> bool:
+    """Unregistered AirTag: type 0x07, length 0x19"""
+    return apple_data.startswith(_PREFIX_UNREGISTERED)
+
+
+# AirTag checks indexed by Apple payload type (apple_data[0])
+_PAYLOAD_HANDLERS = [None] * 256
+_PAYLOAD_HANDLERS[0x12] = _check_registered
+_PAYLOAD_HANDLERS[0x07] = _check_unregistered
+
+
 @dataclass
 class AirTagDevice:
     """Represents a detected AirTag device"""
+    # Explicit __slots__ (dataclass(slots=True) needs Python 3.10+)
+    __slots__ = ('address', 'rssi', 'distance', 'trend', 'count', 'last_seen', 'name',
+                 'last_seen_str', '_last_fmt_bucket', 'rssi_hist', 'hist_idx')
+
     address: str
     rssi: int
     distance: float
     trend: str  # "red", "green", "blue"
     count: int
-    last_seen: datetime
-    details: str
+    last_seen: float  # time.monotonic() of the latest advertisement
+    name: Optional[str]
+
+    def __post_init__(self):
+        # Display cache for format_last_seen(), not part of the dataclass fields
+        self.last_seen_str = ''
+        self._last_fmt_bucket = -1
+
+        # Ring buffer of recent RSSI readings, seeded with the first one
+        self.rssi_hist = array.array('b', [_clamp_rssi(self.rssi)] * RSSI_HISTORY)
+        self.hist_idx = 0
+
+    def record_rssi(self, rssi: int) -> str:
+        """Store a new RSSI reading and return the smoothed trend
+
+        Compares the average of the newer half of the history with the
+        older half, which filters out single-packet fading.
+        """
+        hist = self.rssi_hist
+        hist[self.hist_idx % RSSI_HISTORY] = _clamp_rssi(rssi)
+        self.hist_idx += 1
+
+        # Oldest entry is at hist_idx; both halves have the same length
+        start = self.hist_idx
+        half = RSSI_HISTORY // 2
+        older = sum(hist[(start + i) % RSSI_HISTORY] for i in range(half))
+        newer = sum(hist[(start + i) % RSSI_HISTORY] for i in range(half, RSSI_HISTORY))
+
+        if newer > older:
+            return "red"    # Signal increasing (getting closer)
+        elif newer < older:
+            return "blue"   # Signal decreasing (getting farther)
+        return "green"      # Signal stable
+
+    def format_last_seen(self, now: float) -> str:
+        """Return '<n>s ago' / '<n>m ago', reformatting only when the second changes"""
+        bucket = int(now - self.last_seen)
+        if bucket != self._last_fmt_bucket:
+            self._last_fmt_bucket = bucket
+            if bucket < 60:
+                self.last_seen_str = f"{bucket}s ago"
+            else:
+                self.last_seen_str = f"{bucket // 60}m ago"
+        return self.last_seen_str
+
+    @property
+    def details(self) -> str:
+        """Human readable summary, built on demand instead of per advertisement"""
+        details = f"RSSI: {self.rssi}dBm | Distance: {self.distance:.2f}m"
+        if self.name:
+            details += f" | Name: {self.name}"
+        return details
 
 
 class AirTagDetector:
@@ -50,18 +149,58 @@ class AirTagDetector:
     
     def __init__(self):
         self.detected_airtags: Dict[str, AirTagDevice] = {}
-        self.airtags_lock = threading.Lock()
+        # detected_airtags is owned by the scanner thread; the UI reads the
+        # RSSI-sorted snapshot published after every change
+        self._snapshot: Tuple[AirTagDevice, ...] = ()
+        self._device_count = 0
+        self.display_limit: Optional[int] = None  # Top-N devices the UI shows
+        # Wakes the Rich UI when the device list changes
+        self._dirty_event = threading.Event()
+        self._snapshot_stale = False  # Devices changed since the last publish
+        self._last_publish = 0.0
+        # (expiry time, address) min-heap; outdated entries are skipped lazily
+        self._expiry_heap: List[Tuple[float, str]] = []
         self.console = Console() if RICH_AVAILABLE else None
         self.scanning = False
-        self.scan_count = 0
+        self._scan_started: Optional[float] = None
+        # Created inside the scanner thread's event loop (see scanner_loop)
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._stop_event: Optional[asyncio.Event] = None
+        self.debug_enabled = False  # Collect BLE activity for the debug pane
+        self.debug_buffer = deque(maxlen=10)
         
         # Configuration
         self.tx_power = -59  # Typical value for 1 meter
         self.device_timeout = 60  # Seconds to keep device in list
         self.scan_interval = 1.0  # Seconds between scans
-        
+        self.cleanup_interval = 30.0  # Seconds between stale device sweeps
+        self.batch_interval = 0.1  # Seconds between advertisement batch drains
+        self.redraw_interval = 0.5  # Minimum seconds between UI snapshots/frames
+
+        # Raw advertisements queued by the BLE callback, drained in batches.
+        # deque.append/popleft are atomic, so the callback needs no lock.
+        self._pending_adverts = deque(maxlen=1024)
+
+        # RSSI is a bounded integer, so distances are precomputed once
+        self.build_distance_lut()
+
+        if RICH_AVAILABLE:
+            self._build_display_widgets()
+
+    def build_distance_lut(self):
+        """Precompute distances for RSSI 0..-127 dBm (call again after changing tx_power)"""
+        self._distance_lut = array.array(
+            'd', (self._raw_calc_distance(-i) for i in range(128))
+        )
+
     def calculate_distance(self, rssi: int) -> float:
         """Calculate approximate distance based on RSSI"""
+        if -127 <= rssi <= 0:
+            return self._distance_lut[-rssi]
+        return self._raw_calc_distance(rssi)
+
+    def _raw_calc_distance(self, rssi: int) -> float:
+        """Calculate approximate distance based on RSSI using the path loss model"""
         if rssi == 0:
             return -1.0
             
@@ -94,124 +233,168 @@ class AirTagDetector:
         if len(apple_data) < 2:
             return False
 
-        # Check for AirTag specific payload types
-        payload_type = apple_data[0]
-
-        # Registered AirTag (connected to FindMy network)
-        if payload_type == 0x12:
-            # Should have length 0x19 (25 bytes) and status byte 0x10
-            if len(apple_data) >= 3:
-                payload_length = apple_data[1]
-                if payload_length == 0x19 and len(apple_data) >= 4:
-                    status_byte = apple_data[2]
-                    # Status byte 0x10 indicates AirTag in normal operation
-                    return status_byte == 0x10
-
-        # Unregistered AirTag (not yet connected to FindMy network)
-        elif payload_type == 0x07:
-            # Should have length 0x19 (25 bytes)
-            if len(apple_data) >= 2:
-                payload_length = apple_data[1]
-                return payload_length == 0x19
-
-        return False
+        # Dispatch on the payload type; most Apple types have no handler
+        handler = _PAYLOAD_HANDLERS[apple_data[0]]
+        return handler is not None and handler(apple_data)
     
     def detection_callback(self, device, advertisement_data):
-        """Callback function for BLE device detection"""
-        address = device.address
-        rssi = advertisement_data.rssi
-        
+        """Callback function for BLE device detection
+
+        Runs for every advertisement, so it only queues the raw data;
+        parsing and device bookkeeping happen in _drain_batches().
+        """
         # Check for Apple manufacturer data (0x004C)
         manufacturer_data = advertisement_data.manufacturer_data
         if not manufacturer_data:
             return
-            
-        # Look for Apple manufacturer ID (0x004C = 76 decimal)
-        apple_data = manufacturer_data.get(76)  # 0x004C in decimal
+
+        apple_data = manufacturer_data.get(APPLE_CID)
         if not apple_data:
             return
-            
-        # Debug: Store Apple device info for batch display
-        if len(apple_data) >= 2:
-            payload_type = apple_data[0]
-            payload_length = apple_data[1] if len(apple_data) > 1 else 0
-            debug_info = f"{address} | Type: 0x{payload_type:02x} | Length: 0x{payload_length:02x} | Data: {apple_data.hex()}"
-
-            # Add to debug buffer (limit to last 10 entries)
-            if not hasattr(self, 'debug_buffer'):
-                self.debug_buffer = []
-            self.debug_buffer.append(debug_info)
-            if len(self.debug_buffer) > 10:
-                self.debug_buffer.pop(0)
-
-        # Check if this is actually an AirTag based on advertising data structure
-        if not self.is_airtag(apple_data):
+
+        # Drop Apple payload types that can never be an AirTag (unless the
+        # debug pane wants to show all Apple traffic)
+        if not self.debug_enabled and _PAYLOAD_HANDLERS[apple_data[0]] is None:
             return
-            
-        # Calculate distance
-        distance = self.calculate_distance(rssi)
-        
-        # Build device details
-        details = f"RSSI: {rssi}dBm | Distance: {distance:.2f}m"
-        if device.name:
-            details += f" | Name: {device.name}"
-        
-        # Update device information with thread safety
-        with self.airtags_lock:
-            current_time = datetime.now(timezone.utc)
-            
-            if address in self.detected_airtags:
-                # Update existing device
-                old_device = self.detected_airtags[address]
-                
-                # Calculate trend based on RSSI change
-                if rssi > old_device.rssi:
-                    trend = "red"    # Signal increasing (getting closer)
-                elif rssi < old_device.rssi:
-                    trend = "blue"   # Signal decreasing (getting farther)
-                else:
-                    trend = "green"  # Signal stable
-                
-                # Update device
-                self.detected_airtags[address] = AirTagDevice(
-                    address=address,
-                    rssi=rssi,
-                    distance=distance,
-                    trend=trend,
-                    count=old_device.count + 1,
-                    last_seen=current_time,
-                    details=details
-                )
+
+        self._pending_adverts.append(
+            (device.address, advertisement_data.rssi, apple_data, device.name,
+             time.monotonic())
+        )
+
+    def process_batch(self):
+        """Process every queued advertisement"""
+        pending = self._pending_adverts
+        debug_enabled = self.debug_enabled
+        payload_handlers = _PAYLOAD_HANDLERS
+        batch = {}  # address -> (rssi, name, timestamp, advert count)
+
+        # The callback runs on the same event loop, so nothing is appended
+        # while this loop runs and it ends once the queue is empty
+        while pending:
+            address, rssi, apple_data, name, timestamp = pending.popleft()
+
+            # Debug: Store Apple device info for batch display
+            # (raw tuple, formatted only when the debug pane renders)
+            if debug_enabled and len(apple_data) >= 2:
+                # Add to debug buffer (deque keeps the last 10 entries)
+                self.debug_buffer.append((address, apple_data[0], apple_data[1], apple_data))
+
+            # Check if this is actually an AirTag based on advertising data structure
+            # (same dispatch as is_airtag, inlined for the batch loop)
+            handler = payload_handlers[apple_data[0]]
+            if handler is None or not handler(apple_data):
+                continue
+
+            # Keep only the latest reading per address
+            previous = batch.get(address)
+            batch[address] = (rssi, name, timestamp, previous[3] + 1 if previous else 1)
+
+        if not batch:
+            return
+
+        # Only the scanner thread writes detected_airtags, so no lock is needed
+        for address, (rssi, name, timestamp, adverts) in batch.items():
+            distance = self.calculate_distance(rssi)
+
+            device = self.detected_airtags.get(address)
+            if device is not None:
+                # Calculate trend from the RSSI history
+                trend = device.record_rssi(rssi)
+
+                # Update existing device in place
+                device.rssi = rssi
+                device.distance = distance
+                device.trend = trend
+                device.count += adverts
+                device.last_seen = timestamp
+                if name:
+                    device.name = name
             else:
-                # New device
+                # New device; its single expiry entry is moved forward by
+                # cleanup_stale_devices() while the device keeps being seen
+                heapq.heappush(self._expiry_heap, (timestamp + self.device_timeout, address))
                 self.detected_airtags[address] = AirTagDevice(
                     address=address,
                     rssi=rssi,
                     distance=distance,
                     trend="green",  # Default to stable for new devices
-                    count=1,
-                    last_seen=current_time,
-                    details=details
+                    count=adverts,
+                    last_seen=timestamp,
+                    name=name
                 )
-    
+
+        self._snapshot_stale = True
+        self._publish_if_due()
+
+    def _publish_if_due(self):
+        """Publish pending device changes at most once per redraw_interval"""
+        if not self._snapshot_stale:
+            return
+        if time.monotonic() - self._last_publish < self.redraw_interval:
+            return
+        self._publish_snapshot()
+        self._dirty_event.set()
+
+    async def _drain_batches(self):
+        """Periodically drain queued advertisements while scanning"""
+        while self.scanning:
+            await asyncio.sleep(self.batch_interval)
+            if self._pending_adverts:
+                self.process_batch()
+            else:
+                # Changes throttled by the last batch still need publishing
+                self._publish_if_due()
+
     def cleanup_stale_devices(self):
         """Remove devices that haven't been seen recently"""
-        with self.airtags_lock:
-            current_time = datetime.now(timezone.utc)
-            timeout_threshold = current_time - timedelta(seconds=self.device_timeout)
-            
-            # Find stale devices
-            stale_addresses = [
-                addr for addr, device in self.detected_airtags.items()
-                if device.last_seen < timeout_threshold
-            ]
-            
-            # Remove stale devices
-            for addr in stale_addresses:
+        now = time.monotonic()
+        expiry_heap = self._expiry_heap
+        removed = False
+
+        # Each device has exactly one entry. Only entries whose expiry has
+        # passed are examined; a device seen again since then is re-queued
+        # at its real expiry instead of being removed.
+        while expiry_heap and expiry_heap[0][0] < now:
+            _, addr = heapq.heappop(expiry_heap)
+            device = self.detected_airtags.get(addr)
+            if device is None:
+                continue
+            expiry = device.last_seen + self.device_timeout
+            if expiry < now:
                 del self.detected_airtags[addr]
+                removed = True
+            else:
+                heapq.heappush(expiry_heap, (expiry, addr))
+
+        if removed:
+            self._publish_snapshot()
+            self._dirty_event.set()
+
+    def _publish_snapshot(self):
+        """Publish an RSSI-sorted tuple of devices for the UI thread
+
+        Called from the scanner thread after it changes detected_airtags;
+        the attribute store is atomic, so readers never need a lock. With
+        display_limit set only the strongest devices are selected, which
+        avoids a full sort.
+        """
+        devices = self.detected_airtags.values()
+        if self.display_limit is None:
+            snapshot = tuple(sorted(devices, key=_BY_RSSI, reverse=True))
+        else:
+            snapshot = tuple(heapq.nlargest(self.display_limit, devices, key=_BY_RSSI))
+        self._device_count = len(self.detected_airtags)
+        self._snapshot = snapshot
+        self._snapshot_stale = False
+        self._last_publish = time.monotonic()
+
+    def _get_sorted_snapshot(self) -> Tuple[AirTagDevice, ...]:
+        """Return detected devices sorted by RSSI (strongest signal first)"""
+        return self._snapshot
     
-    def create_display_table(self) -> Table:
-        """Create Rich table for displaying AirTags"""
+    def _new_table(self) -> Table:
+        """Empty AirTag table with its column definitions"""
         table = Table(
             title="🏷️  Detected AirTags",
             box=box.ROUNDED,
@@ -226,29 +409,40 @@ class AirTagDetector:
         table.add_column("Trend", justify="center", style="white")
         table.add_column("Count", justify="right", style="blue")
         table.add_column("Last Seen", style="dim")
+        return table
+
+    def _build_display_widgets(self):
+        """Create the Rich panels once; renderers refill them"""
+        self._status_text = Text()
+        self._build_status_template()
+        self._status_panel = Panel(
+            self._status_text,
+            title="📡 PyTAG Status",
+            border_style="blue"
+        )
+        self._ble_activity_panel = Panel(
+            "",
+            title="🔍 BLE Communication Activity",
+            border_style="yellow",
+            height=12
+        )
+
+    def create_display_table(self) -> Table:
+        """Create Rich table for displaying AirTags"""
+        # A fresh table per frame; building it is cheap next to rendering
+        table = self._new_table()
         
-        # Add rows with thread safety
-        with self.airtags_lock:
-            devices_copy = dict(self.detected_airtags)
-        
-        if not devices_copy:
+        # Sorted by RSSI (strongest signal first)
+        sorted_devices = self._get_sorted_snapshot()
+
+        if not sorted_devices:
             table.add_row("No AirTags detected", "", "", "", "", "")
             return table
         
-        # Sort by RSSI (strongest signal first)
-        sorted_devices = sorted(
-            devices_copy.items(),
-            key=lambda x: x[1].rssi,
-            reverse=True
-        )
-        
-        for address, device in sorted_devices:
+        now = time.monotonic()
+        for device in sorted_devices:
             # Format last seen time
-            time_diff = datetime.now(timezone.utc) - device.last_seen
-            if time_diff.total_seconds() < 60:
-                last_seen = f"{int(time_diff.total_seconds())}s ago"
-            else:
-                last_seen = f"{int(time_diff.total_seconds() / 60)}m ago"
+            last_seen = device.format_last_seen(now)
             
             # Get trend color and symbol
             trend_color = self.get_trend_color(device.trend)
@@ -265,40 +459,82 @@ class AirTagDetector:
         
         return table
     
+    def _build_status_template(self):
+        """Bake the static status lines (labels and configuration) into a template"""
+        self._status_template = (
+            "🔍 Scanning Status: {}\n"
+            "📊 Scan Count: {}\n"
+            "🏷️  AirTags Found: {}\n"
+            f"⏰ Device Timeout: {self.device_timeout}s\n"
+            f"🔄 Scan Interval: {self.scan_interval}s\n"
+            "\n"
+            "💡 Press Ctrl+C to stop scanning"
+        )
+
     def create_status_panel(self) -> Panel:
         """Create status information panel"""
-        status_text = f"""
-🔍 Scanning Status: {'🟢 Active' if self.scanning else '🔴 Stopped'}
-📊 Scan Count: {self.scan_count}
-🏷️  AirTags Found: {len(self.detected_airtags)}
-⏰ Device Timeout: {self.device_timeout}s
-🔄 Scan Interval: {self.scan_interval}s
-
-💡 Press Ctrl+C to stop scanning
-        """.strip()
-
-        return Panel(
-            status_text,
-            title="📡 PyTAG Status",
-            border_style="blue"
+        # Only the counters change between frames
+        self._status_text.plain = self._status_template.format(
+            '🟢 Active' if self.scanning else '🔴 Stopped',
+            self.scan_count,
+            self._device_count
         )
+        return self._status_panel
+
+    def format_debug_entry(self, entry: Tuple[str, int, int, bytes]) -> str:
+        """Format a raw debug buffer entry for display"""
+        address, payload_type, payload_length, apple_data = entry
+        return f"{address} | Type: 0x{payload_type:02x} | Length: 0x{payload_length:02x} | Data: {apple_data.hex()}"
 
     def create_ble_activity_panel(self) -> Panel:
         """Create BLE activity panel"""
-        if hasattr(self, 'debug_buffer') and self.debug_buffer:
-            activity_text = "\n".join(self.debug_buffer[-8:])  # Show last 8 entries
+        if self.debug_buffer:
+            activity_text = "\n".join(
+                self.format_debug_entry(entry)
+                for entry in list(self.debug_buffer)[-8:]  # Show last 8 entries
+            )
         else:
             activity_text = "Waiting for BLE activity..."
 
-        return Panel(
-            activity_text,
-            title="🔍 BLE Communication Activity",
-            border_style="yellow",
-            height=12
-        )
+        self._ble_activity_panel.renderable = activity_text
+        return self._ble_activity_panel
+
+    @property
+    def scan_count(self) -> int:
+        """Number of scan intervals elapsed since scanning started"""
+        if self._scan_started is None:
+            return 0
+        return int((time.monotonic() - self._scan_started) / self.scan_interval)
+
+    async def _periodic_cleanup(self):
+        """Remove stale devices on a fixed timer while scanning"""
+        while True:
+            await asyncio.sleep(self.cleanup_interval)
+            self.cleanup_stale_devices()
+
+    async def _wait_for_stop(self, timeout: float):
+        """Sleep up to timeout seconds, returning early if scanning is stopped"""
+        try:
+            await asyncio.wait_for(self._stop_event.wait(), timeout)
+        except asyncio.TimeoutError:
+            pass
+
+    def stop_scanning(self):
+        """Stop scanning and wake the scanner thread (safe from any thread)"""
+        self.scanning = False
+        self._dirty_event.set()
+        loop = self._loop
+        if loop is not None and not loop.is_closed():
+            try:
+                loop.call_soon_threadsafe(self._stop_event.set)
+            except RuntimeError:
+                pass  # Loop closed in the meantime
 
     async def scanner_loop(self):
         """Main BLE scanning loop with auto-restart capability"""
+        self._stop_event = asyncio.Event()
+        self._loop = asyncio.get_running_loop()
+
         while self.scanning:
             try:
                 if self.console:
@@ -309,15 +545,17 @@ class AirTagDetector:
                 scanner = BleakScanner(detection_callback=self.detection_callback)
 
                 await scanner.start()
+                if self._scan_started is None:
+                    self._scan_started = time.monotonic()
+                drain_task = asyncio.create_task(self._drain_batches())
+                cleanup_task = asyncio.create_task(self._periodic_cleanup())
 
-                # Keep scanning until stopped
-                while self.scanning:
-                    await asyncio.sleep(self.scan_interval)
-                    self.scan_count += 1
-
-                    # Cleanup stale devices periodically
-                    if self.scan_count % 30 == 0:  # Every 30 scans
-                        self.cleanup_stale_devices()
+                try:
+                    # Keep scanning until stopped
+                    await self._stop_event.wait()
+                finally:
+                    drain_task.cancel()
+                    cleanup_task.cancel()
 
                 await scanner.stop()
 
@@ -328,7 +566,7 @@ class AirTagDetector:
                 else:
                     print(f"❌ BLEAK ERROR: {e}")
                     print("🔄 Restarting scanner in 5 seconds...")
-                await asyncio.sleep(5)
+                await self._wait_for_stop(5)
 
             except Exception as e:
                 if self.console:
@@ -337,7 +575,7 @@ class AirTagDetector:
                 else:
                     print(f"❌ UNEXPECTED ERROR: {e}")
                     print("🔄 Restarting scanner in 15 seconds...")
-                await asyncio.sleep(15)
+                await self._wait_for_stop(15)
 
     def start_scanner_thread(self):
         """Start the BLE scanner in a separate thread"""
@@ -359,6 +597,8 @@ class AirTagDetector:
             return self.run_simple_mode()
 
         self.scanning = True
+        self.debug_enabled = True  # BLE activity pane is part of the layout
+        self._build_status_template()  # Pick up the final timeout/interval
 
         # Start scanner in background thread
         scanner_thread = self.start_scanner_thread()
@@ -372,15 +612,25 @@ class AirTagDetector:
                 Layout(name="airtags")
             )
 
-            with Live(layout, refresh_per_second=2, screen=True) as live:
+            # The table and panels are reused between frames, so refresh
+            # manually after refilling them instead of from Live's thread
+            with Live(layout, auto_refresh=False, screen=True) as live:
                 while self.scanning:
                     try:
                         # Update layout
                         layout["status"].update(self.create_status_panel())
                         layout["ble_activity"].update(self.create_ble_activity_panel())
                         layout["airtags"].update(self.create_display_table())
+                        live.refresh()
+                        frame_time = time.monotonic()
 
-                        time.sleep(0.5)  # Update every 500ms
+                        # Redraw when devices change, at least every
+                        # redraw_interval but never more often (2 Hz)
+                        self._dirty_event.wait(timeout=self.redraw_interval)
+                        self._dirty_event.clear()
+                        remaining = frame_time + self.redraw_interval - time.monotonic()
+                        if remaining > 0 and self.scanning:
+                            time.sleep(remaining)
 
                     except KeyboardInterrupt:
                         break
@@ -388,7 +638,7 @@ class AirTagDetector:
         except KeyboardInterrupt:
             pass
         finally:
-            self.scanning = False
+            self.stop_scanning()
             if self.console:
                 self.console.print("\n🛑 Stopping scanner...", style="yellow")
             else:
@@ -402,9 +652,97 @@ class AirTagDetector:
             else:
                 print("✅ PyTAG stopped successfully!")
 
+    def build_simple_frame(self) -> str:
+        """Build one simple-mode screen as a single string"""
+        lines = [
+            "🔍 PyTAG - AirTag Detector",
+            f"📊 Scans: {self.scan_count} | AirTags: {self._device_count}",
+            "=" * 80,
+        ]
+
+        # Split screen layout - BLE Activity (left) and AirTags (right)
+        ble_lines = []
+        airtag_lines = []
+
+        # Prepare BLE Activity lines (left column) - reduced
+        ble_lines.append("🔍 BLE Activity:")
+        ble_lines.append("-" * 38)
+        if self.debug_buffer:
+            for entry in list(self.debug_buffer)[-4:]:  # Show last 4 only
+                debug_line = self.format_debug_entry(entry)
+                # Truncate long lines to fit column
+                if len(debug_line) > 36:
+                    ble_lines.append(f"{debug_line[:33]}...")
+                else:
+                    ble_lines.append(debug_line)
+        else:
+            ble_lines.append("Waiting for BLE activity...")
+
+        # Pad BLE lines to smaller height
+        while len(ble_lines) < 8:
+            ble_lines.append("")
+
+        # Prepare AirTag lines (right column) - expanded
+        airtag_lines.append("🏷️  AirTag Detection Results:")
+        airtag_lines.append("-" * 38)
+
+        # Sorted by RSSI (strongest signal first)
+        sorted_devices = self._get_sorted_snapshot()
+
+        if sorted_devices:
+            airtag_lines.append("┌─ DETECTED AIRTAGS ─────────────┐")
+            airtag_lines.append(f"│ Found: {self._device_count} AirTag(s)")
+            airtag_lines.append("├────────────────────────────────┤")
+
+            now = time.monotonic()
+            for i, device in enumerate(sorted_devices[:3]):  # Show max 3 AirTags
+                # Format last seen time
+                last_seen = device.format_last_seen(now)
+
+                trend_symbol = self.get_trend_symbol(device.trend)
+
+                # Detailed display for each AirTag
+                airtag_lines.append(f"│ 📍 {device.address[:17]}")
+                airtag_lines.append(f"│ 📶 RSSI: {device.rssi} dBm")
+                airtag_lines.append(f"│ 📏 Distance: {device.distance:.1f}m {trend_symbol}")
+                airtag_lines.append(f"│ 📊 Detections: {device.count}")
+                airtag_lines.append(f"│ 🕐 Last seen: {last_seen}")
+                if i < len(sorted_devices) - 1 and i < 2:  # Add separator
+                    airtag_lines.append("├────────────────────────────────┤")
+
+            airtag_lines.append("└────────────────────────────────┘")
+        else:
+            airtag_lines.append("┌─ AIRTAG STATUS ────────────────┐")
+            airtag_lines.append("│                                │")
+            airtag_lines.append("│        No AirTags found        │")
+            airtag_lines.append("│                                │")
+            airtag_lines.append("│     🔍 Monitoring active...    │")
+            airtag_lines.append("│                                │")
+            airtag_lines.append("│   ✅ Expected if none nearby   │")
+            airtag_lines.append("│                                │")
+            airtag_lines.append("└────────────────────────────────┘")
+
+        # Pad AirTag lines to larger height for more space
+        while len(airtag_lines) < 15:
+            airtag_lines.append("")
+
+        # Side-by-side layout with more lines
+        lines.append("")
+        for i in range(15):
+            ble_part = ble_lines[i] if i < len(ble_lines) else ""
+            airtag_part = airtag_lines[i] if i < len(airtag_lines) else ""
+
+            # Format with fixed widths (38 chars each + separator)
+            lines.append(f"{ble_part:<38} | {airtag_part}")
+
+        lines.append("\n💡 Press Ctrl+C to stop scanning")
+        return "\n".join(lines) + "\n"
+
     def run_simple_mode(self):
         """Run in simple mode without Rich UI"""
         self.scanning = True
+        self.debug_enabled = True  # BLE activity column is part of the frame
+        self.display_limit = 3  # Only the strongest AirTags fit in the frame
 
         # Start scanner in background thread
         scanner_thread = self.start_scanner_thread()
@@ -413,101 +751,13 @@ class AirTagDetector:
             print("🔍 PyTAG - AirTag Detector Started")
             print("💡 Press Ctrl+C to stop\n")
 
+            enable_ansi_escapes()
+
             while self.scanning:
                 try:
-                    # Clear screen (simple)
-                    os.system('clear' if os.name == 'posix' else 'cls')
-
-                    # Compact header
-                    print("🔍 PyTAG - AirTag Detector")
-                    print(f"📊 Scans: {self.scan_count} | AirTags: {len(self.detected_airtags)}")
-                    print("=" * 80)
-
-                    # Split screen layout - BLE Activity (left) and AirTags (right)
-                    ble_lines = []
-                    airtag_lines = []
-
-                    # Prepare BLE Activity lines (left column) - reduced
-                    ble_lines.append("🔍 BLE Activity:")
-                    ble_lines.append("-" * 38)
-                    if hasattr(self, 'debug_buffer') and self.debug_buffer:
-                        for debug_line in self.debug_buffer[-4:]:  # Show last 4 only
-                            # Truncate long lines to fit column
-                            if len(debug_line) > 36:
-                                ble_lines.append(f"{debug_line[:33]}...")
-                            else:
-                                ble_lines.append(debug_line)
-                    else:
-                        ble_lines.append("Waiting for BLE activity...")
-
-                    # Pad BLE lines to smaller height
-                    while len(ble_lines) < 8:
-                        ble_lines.append("")
-
-                    # Prepare AirTag lines (right column) - expanded
-                    airtag_lines.append("🏷️  AirTag Detection Results:")
-                    airtag_lines.append("-" * 38)
-
-                    with self.airtags_lock:
-                        devices_copy = dict(self.detected_airtags)
-
-                    if devices_copy:
-                        # Sort by RSSI (strongest signal first)
-                        sorted_devices = sorted(
-                            devices_copy.items(),
-                            key=lambda x: x[1].rssi,
-                            reverse=True
-                        )
-
-                        airtag_lines.append("┌─ DETECTED AIRTAGS ─────────────┐")
-                        airtag_lines.append(f"│ Found: {len(devices_copy)} AirTag(s)")
-                        airtag_lines.append("├────────────────────────────────┤")
-
-                        for i, (address, device) in enumerate(sorted_devices[:3]):  # Show max 3 AirTags
-                            # Format last seen time
-                            time_diff = datetime.now(timezone.utc) - device.last_seen
-                            if time_diff.total_seconds() < 60:
-                                last_seen = f"{int(time_diff.total_seconds())}s"
-                            else:
-                                last_seen = f"{int(time_diff.total_seconds() // 60)}m"
-
-                            trend_symbol = self.get_trend_symbol(device.trend)
-
-                            # Detailed display for each AirTag
-                            airtag_lines.append(f"│ 📍 {address[:17]}")
-                            airtag_lines.append(f"│ 📶 RSSI: {device.rssi} dBm")
-                            airtag_lines.append(f"│ 📏 Distance: {device.distance:.1f}m {trend_symbol}")
-                            airtag_lines.append(f"│ 📊 Detections: {device.count}")
-                            airtag_lines.append(f"│ 🕐 Last seen: {last_seen} ago")
-                            if i < len(sorted_devices) - 1 and i < 2:  # Add separator
-                                airtag_lines.append("├────────────────────────────────┤")
-
-                        airtag_lines.append("└────────────────────────────────┘")
-                    else:
-                        airtag_lines.append("┌─ AIRTAG STATUS ────────────────┐")
-                        airtag_lines.append("│                                │")
-                        airtag_lines.append("│        No AirTags found        │")
-                        airtag_lines.append("│                                │")
-                        airtag_lines.append("│     🔍 Monitoring active...    │")
-                        airtag_lines.append("│                                │")
-                        airtag_lines.append("│   ✅ Expected if none nearby   │")
-                        airtag_lines.append("│                                │")
-                        airtag_lines.append("└────────────────────────────────┘")
-
-                    # Pad AirTag lines to larger height for more space
-                    while len(airtag_lines) < 15:
-                        airtag_lines.append("")
-
-                    # Print side-by-side layout with more lines
-                    print()
-                    for i in range(15):
-                        ble_part = ble_lines[i] if i < len(ble_lines) else ""
-                        airtag_part = airtag_lines[i] if i < len(airtag_lines) else ""
-
-                        # Format with fixed widths (38 chars each + separator)
-                        print(f"{ble_part:<38} | {airtag_part}")
-
-                    print("\n💡 Press Ctrl+C to stop scanning")
+                    # Clear screen and draw the whole frame in a single write
+                    sys.stdout.write(ANSI_CLEAR_SCREEN + self.build_simple_frame())
+                    sys.stdout.flush()
 
                     time.sleep(2)  # Update every 2 seconds
 
@@ -517,7 +767,7 @@ class AirTagDetector:
         except KeyboardInterrupt:
             pass
         finally:
-            self.scanning = False
+            self.stop_scanning()
             print("\n🛑 Stopping scanner...")
 
             # Wait for scanner thread to finish
@@ -526,9 +776,25 @@ class AirTagDetector:
             print("✅ PyTAG stopped successfully!")
 
 
+def enable_ansi_escapes():
+    """Enable ANSI escape sequences on Windows consoles (no-op elsewhere)"""
+    if os.name != 'nt':
+        return
+    try:
+        import ctypes
+        kernel32 = ctypes.windll.kernel32
+        handle = kernel32.GetStdHandle(-11)  # STD_OUTPUT_HANDLE
+        mode = ctypes.c_uint32()
+        if kernel32.GetConsoleMode(handle, ctypes.byref(mode)):
+            # ENABLE_VIRTUAL_TERMINAL_PROCESSING
+            kernel32.SetConsoleMode(handle, mode.value | 0x0004)
+    except Exception:
+        pass
+
+
 def check_bluetooth_permissions():
     """Check if we have proper Bluetooth permissions"""
-    if os.geteuid() != 0:
+    if not IS_ROOT:
         print("⚠️  Warning: Running without root privileges")
         print("💡 If scanning fails, try:")
         print("   sudo python3 main.py")
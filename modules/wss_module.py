@@ -14,27 +14,100 @@ Features:
 """
 
 import subprocess
+import shutil
+import heapq
 import json
 import time
 import re
+import sys
+import queue
+import threading
+from collections import Counter, deque
 from datetime import datetime
-from dataclasses import dataclass, asdict
-from typing import List, Optional, Tuple
+from operator import attrgetter
+from dataclasses import dataclass, asdict, field
+from typing import Deque, List, Optional, Sequence, Set, Tuple
 from pathlib import Path
 
 # Rich library for beautiful terminal interface
 try:
-    from rich.console import Console
+    from rich.console import Console, Group
     from rich.table import Table
+    from rich.live import Live
     from rich.panel import Panel
-    from rich.progress import Progress, SpinnerColumn, TextColumn, BarColumn, TimeRemainingColumn
+    from rich.text import Text
     from rich.prompt import Prompt
     RICH_AVAILABLE = True
 except ImportError:
     RICH_AVAILABLE = False
     print("⚠️  For better appearance install rich: pip install rich")
 
-@dataclass
+# Optional faster JSON library; falls back to the standard json module
+try:
+    import orjson
+
+    def _json_loads(data):
+        return orjson.loads(data)
+
+    def _json_dumps_pretty(obj) -> str:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode('utf-8')
+
+    def _json_dumps_compact(obj) -> str:
+        return orjson.dumps(obj).decode('utf-8')
+except ImportError:
+    def _json_loads(data):
+        return json.loads(data)
+
+    def _json_dumps_pretty(obj) -> str:
+        return json.dumps(obj, indent=2, ensure_ascii=False)
+
+    def _json_dumps_compact(obj) -> str:
+        return json.dumps(obj, separators=(',', ':'), ensure_ascii=False)
+
+# __slots__ for the data classes where supported (dataclass(slots=True) is 3.10+)
+_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+def _iso_timestamp(timestamp: Optional[float]) -> Optional[str]:
+    """Format a time.time() timestamp as local ISO 8601"""
+    if timestamp is None:
+        return None
+    return datetime.fromtimestamp(timestamp).isoformat()
+
+_BY_SIGNAL = attrgetter('signal')
+
+# Field order for `nmcli -t device wifi list`: BSSID first (fixed width),
+# SSID last (may contain escaped colons)
+NMCLI_WIFI_FIELDS = "BSSID,SIGNAL,FREQ,CHAN,SECURITY,SSID"
+_NMCLI_LINE_RE = re.compile(
+    r'(?P<bssid>(?:[0-9A-Fa-f]{2}\\:){5}[0-9A-Fa-f]{2})'
+    r':(?P<signal>\d+):(?P<freq>[^:]*):(?P<chan>\d*):(?P<security>[^:]*):(?P<ssid>.*)'
+)
+_NMCLI_UNESCAPE_RE = re.compile(r'\\(.)')
+
+# WiFi channel by centre frequency (MHz)
+_FREQ_TO_CHAN = {
+    # 2.4GHz band channels
+    **{2412 + 5 * i: 1 + i for i in range(13)},
+    2484: 14,
+    # 5GHz band channels (common channels)
+    5180: 36, 5200: 40, 5220: 44, 5240: 48,
+    5260: 52, 5280: 56, 5300: 60, 5320: 64,
+    5500: 100, 5520: 104, 5540: 108, 5560: 112,
+    5580: 116, 5600: 120, 5620: 124, 5640: 128,
+    5660: 132, 5680: 136, 5700: 140, 5720: 144,
+    5745: 149, 5765: 153, 5785: 157, 5805: 161,
+    5825: 165
+}
+
+def _signal_to_rssi(signal: int) -> int:
+    """Approximate RSSI (dBm) from NetworkManager signal strength (0-100 %)"""
+    return signal // 2 - 100
+
+def _missing_dependencies() -> Tuple[str, ...]:
+    """System tools not found on PATH"""
+    return tuple(dep for dep in ('nmcli', 'ping', 'iwconfig') if shutil.which(dep) is None)
+
+@dataclass(**_SLOTS)
 class WiFiNetwork:
     """WiFi network representation"""
     ssid: str
@@ -45,24 +118,19 @@ class WiFiNetwork:
     channel: Optional[int] = None
     bssid: Optional[str] = None
     rssi: Optional[int] = None
-    timestamp: Optional[str] = None
+    timestamp: Optional[float] = field(default_factory=time.time)
 
     def __post_init__(self):
-        if self.timestamp is None:
-            self.timestamp = datetime.now().isoformat()
-
-        # Determine band based on frequency (MHz)
-        if self.frequency and self.frequency > 0:
-            if 2400 <= self.frequency <= 2500:
-                self.band = "2.4GHz"
-            elif 5000 <= self.frequency <= 6000:
-                self.band = "5GHz"
-            elif self.frequency >= 6000:
-                self.band = "6GHz"
-            else:
-                self.band = "Unknown"
-        else:
-            self.band = "Unknown"
+        # Determine band based on frequency (MHz); 6GHz starts at 5925
+        f = self.frequency or 0
+        self.band = ('2.4GHz' if 2400 <= f <= 2500 else
+                     '5GHz' if 5000 <= f < 5925 else
+                     '6GHz' if 5925 <= f <= 7125 else 'Unknown')
+
+    @property
+    def timestamp_iso(self) -> Optional[str]:
+        """Timestamp formatted as ISO 8601"""
+        return _iso_timestamp(self.timestamp)
 
     @property
     def is_open(self) -> bool:
@@ -81,20 +149,21 @@ class WiFiNetwork:
         else:
             return "Very weak"
 
-@dataclass
+@dataclass(**_SLOTS)
 class NetworkDevice:
     """Network device representation"""
     ip_address: str
     mac_address: str
     hostname: Optional[str] = None
     vendor: Optional[str] = None
-    timestamp: Optional[str] = None
+    timestamp: Optional[float] = field(default_factory=time.time)
 
-    def __post_init__(self):
-        if self.timestamp is None:
-            self.timestamp = datetime.now().isoformat()
+    @property
+    def timestamp_iso(self) -> Optional[str]:
+        """Timestamp formatted as ISO 8601"""
+        return _iso_timestamp(self.timestamp)
 
-@dataclass
+@dataclass(**_SLOTS)
 class ConnectionAttempt:
     """Connection attempt representation"""
     ssid: str
@@ -120,7 +189,12 @@ class WiFiConfig:
             "ping_timeout": 5,
             "connection_timeout": 15,
             "auto_cleanup": True,
-            "export_format": "json"
+            "export_format": "json",
+            "scan_cache_ttl": 25,
+            "scan_interval_connected": 60,
+            "ssid_filter": None,
+            "bssid_filter": None,
+            "max_history": 5000
         }
         self.config = self.load_config()
 
@@ -129,7 +203,7 @@ class WiFiConfig:
         if self.config_file.exists():
             try:
                 with open(self.config_file, 'r', encoding='utf-8') as f:
-                    return {**self.default_config, **json.load(f)}
+                    return {**self.default_config, **_json_loads(f.read())}
             except Exception as e:
                 print(f"⚠️  Error loading configuration: {e}")
 
@@ -139,7 +213,7 @@ class WiFiConfig:
         """Save configuration to file"""
         try:
             with open(self.config_file, 'w', encoding='utf-8') as f:
-                json.dump(self.config, f, indent=2, ensure_ascii=False)
+                f.write(_json_dumps_pretty(self.config))
         except Exception as e:
             print(f"❌ Error saving configuration: {e}")
     
@@ -159,15 +233,35 @@ class WiFiScanner:
         self.log_dir.mkdir(exist_ok=True)
 
         # Lists for storing data
-        self.discovered_networks: List[WiFiNetwork] = []
+        # Oldest networks are dropped once max_history is reached
+        self.discovered_networks: Deque[WiFiNetwork] = deque(
+            maxlen=self.config.get('max_history', 5000)
+        )
         self.connection_attempts: List[ConnectionAttempt] = []
         self.discovered_devices: List[NetworkDevice] = []
+        # (ssid, bssid) of every entry in discovered_networks
+        self._network_keys: Set[Tuple[str, str]] = set()
 
-    def run_command(self, cmd: str, timeout: int = 30) -> Tuple[bool, str]:
-        """Execute system command"""
+        # Most recent scan result, reused while younger than scan_cache_ttl
+        self._last_networks: List[WiFiNetwork] = []
+        self._last_scan = 0.0
+
+        # Interface association state, refreshed by _current_interval()
+        self._connected = False
+
+        # Rich widgets for continuous scanning, built on first use
+        self._stats_panel = None
+
+        # Background scanning for the Rich UI: the worker posts None when a
+        # scan starts and (networks, interval) when it is done
+        self._scan_q: "queue.Queue" = queue.Queue(maxsize=1)
+        self._scan_stop = threading.Event()
+
+    def run_command(self, cmd: Sequence[str], timeout: int = 30) -> Tuple[bool, str]:
+        """Execute system command (argv list, no shell)"""
         try:
             result = subprocess.run(
-                cmd, shell=True, capture_output=True,
+                list(cmd), capture_output=True,
                 text=True, timeout=timeout
             )
             return result.returncode == 0, result.stdout
@@ -176,15 +270,19 @@ class WiFiScanner:
         except Exception as e:
             return False, str(e)
 
+    def _run_command_stream(self, cmd: Sequence[str]) -> Optional[subprocess.Popen]:
+        """Start system command with stdout piped for line-by-line reading"""
+        try:
+            return subprocess.Popen(
+                list(cmd), stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL, text=True, errors="replace"
+            )
+        except Exception:
+            return None
+
     def check_dependencies(self) -> bool:
         """Check system dependencies"""
-        dependencies = ['nmcli', 'ping', 'iwconfig']
-        missing = []
-
-        for dep in dependencies:
-            success, _ = self.run_command(f"which {dep}")
-            if not success:
-                missing.append(dep)
+        missing = _missing_dependencies()
 
         if missing:
             print(f"❌ Missing dependencies: {', '.join(missing)}")
@@ -192,52 +290,79 @@ class WiFiScanner:
 
         return True
     
-    def scan_networks(self) -> List[WiFiNetwork]:
-        """Scan available WiFi networks"""
-        # Start rescan
-        self.run_command("nmcli device wifi rescan", timeout=15)
-        time.sleep(2)
-
-        # Get network list with detailed information
-        # First try to get RSSI with iwlist, fallback to nmcli
-        rssi_data = {}
-        rssi_success, rssi_output = self.run_command(
-            f"iwlist {self.config.get('interface')} scan | grep -E 'ESSID|Signal level'"
+    def scan_networks(self, force: bool = False) -> List[WiFiNetwork]:
+        """Scan available WiFi networks
+
+        Returns the previous result while it is younger than scan_cache_ttl
+        seconds unless force is set.
+        """
+        if (not force and self._last_scan
+                and time.monotonic() - self._last_scan < self.config.get('scan_cache_ttl', 25)):
+            return self._last_networks
+
+        # Get basic network list from nmcli, parsed while it is streamed.
+        # Rescan (active) only while disconnected; when associated,
+        # NetworkManager's own periodic scan results are used (passive).
+        # With --rescan yes nmcli returns as soon as the scan has finished
+        # instead of after a fixed delay.
+        rescan = "no" if self._connected else "yes"
+        proc = self._run_command_stream(
+            ["nmcli", "-t", "--escape", "yes", "-f", NMCLI_WIFI_FIELDS,
+             "device", "wifi", "list", "--rescan", rescan]
         )
 
-        if rssi_success:
-            current_ssid = None
-            for line in rssi_output.split('\n'):
-                if 'ESSID:' in line:
-                    current_ssid = line.split('ESSID:')[1].strip().strip('"')
-                elif 'Signal level=' in line and current_ssid:
-                    try:
-                        rssi = int(line.split('Signal level=')[1].split(' ')[0])
-                        rssi_data[current_ssid] = rssi
-                    except:
-                        pass
-
-        # Get basic network list from nmcli
-        success, output = self.run_command(
-            "nmcli -t -f SSID,SECURITY,SIGNAL,FREQ,BSSID,CHAN device wifi list"
-        )
+        if proc is None:
+            return []
+
+        # Kill nmcli if it has not finished within 30 s; reading stdout would
+        # otherwise block for as long as it stalls
+        timed_out = threading.Event()
+
+        def _kill_stalled():
+            timed_out.set()
+            proc.kill()
+
+        watchdog = threading.Timer(30, _kill_stalled)
+        watchdog.daemon = True
+
+        with proc:
+            watchdog.start()
+            try:
+                networks = self._read_nmcli_networks(proc.stdout)
+                proc.wait()
+            finally:
+                watchdog.cancel()
 
-        if not success:
+        if timed_out.is_set() or proc.returncode != 0:
             return []
 
+        # Add only new networks to discovered networks list (deduplicate by SSID+BSSID)
+        self._add_unique_networks(networks)
+
+        self._last_networks = networks
+        self._last_scan = time.monotonic()
+        return networks
+
+    def _read_nmcli_networks(self, lines) -> List[WiFiNetwork]:
+        """Build WiFiNetwork objects from streamed nmcli lines"""
+        # Optional allow-lists; networks outside them are never materialized
+        ssid_filter = self.config.get('ssid_filter')
+        ssid_filter = set(ssid_filter) if ssid_filter else None
+        bssid_filter = self.config.get('bssid_filter')
+        bssid_filter = {b.upper() for b in bssid_filter} if bssid_filter else None
+
         networks = []
-        for line in output.strip().split('\n'):
-            # Use robust parsing method
+        for line in lines:
+            # Use robust parsing method (hidden networks are dropped there)
             parsed_data = self._parse_nmcli_line_robust(line)
             if not parsed_data:
                 continue
 
             ssid = parsed_data['ssid']
-            if not ssid:  # Skip empty SSID
+            if ssid_filter is not None and ssid not in ssid_filter:
+                continue
+            if bssid_filter is not None and parsed_data['bssid'] not in bssid_filter:
                 continue
-
-            # Get RSSI if available
-            rssi = rssi_data.get(ssid, None)
 
             network = WiFiNetwork(
                 ssid=ssid,
@@ -247,102 +372,73 @@ class WiFiScanner:
                 band="Unknown",  # Will be determined in __post_init__
                 channel=parsed_data['channel'],
                 bssid=parsed_data['bssid'],
-                rssi=rssi
+                rssi=_signal_to_rssi(parsed_data['signal'])
             )
             networks.append(network)
 
-        # Add only new networks to discovered networks list (deduplicate by SSID+BSSID)
-        self._add_unique_networks(networks)
         return networks
 
-    def _add_unique_networks(self, new_networks: List[WiFiNetwork]):
-        """Add only unique networks to discovered_networks list"""
-        # Create a set of existing network identifiers (SSID + BSSID combination)
-        existing_networks = set()
-        for network in self.discovered_networks:
-            # Use SSID + BSSID as unique identifier (BSSID is MAC address of access point)
-            identifier = f"{network.ssid}|{network.bssid or 'no_bssid'}"
-            existing_networks.add(identifier)
-
-        # Add only networks that don't already exist
-        for network in new_networks:
-            identifier = f"{network.ssid}|{network.bssid or 'no_bssid'}"
-            if identifier not in existing_networks:
-                self.discovered_networks.append(network)
-                existing_networks.add(identifier)  # Update set for next iterations
-
-    def _validate_bssid(self, bssid: str) -> Optional[str]:
-        """Validate and clean BSSID format"""
-        if not bssid:
-            return None
-
-        # Remove any escape characters or extra backslashes
-        bssid = bssid.replace('\\', '').strip()
+    def _current_interval(self) -> int:
+        """Return the scan interval for the current connection state
 
-        # Check if it's a valid MAC address format
-        mac_pattern = re.compile(r'^([0-9A-Fa-f]{2}[:-]){5}([0-9A-Fa-f]{2})$')
-        if mac_pattern.match(bssid):
-            return bssid.upper()  # Normalize to uppercase
+        Scans are stretched to scan_interval_connected while the interface
+        is associated and use scan_interval while looking for networks.
+        """
+        success, output = self.run_command(
+            ["nmcli", "-t", "-f", "DEVICE,STATE", "device", "status"], timeout=5
+        )
+        interface = self.config.get('interface')
+        self._connected = success and any(
+            line.split(':', 1) == [interface, 'connected']
+            for line in output.splitlines()
+        )
 
-        # Check if it's a partial MAC (just first part)
-        partial_pattern = re.compile(r'^[0-9A-Fa-f]{2}$')
-        if partial_pattern.match(bssid):
-            # This is likely a parsing error - return None to indicate invalid
-            return None
+        if self._connected:
+            return self.config.get('scan_interval_connected', 60)
+        return self.config.get('scan_interval')
 
-        return None
+    def _add_unique_networks(self, new_networks: List[WiFiNetwork]):
+        """Add only unique networks to discovered_networks list"""
+        # SSID + BSSID identifies a network (BSSID is MAC address of access point)
+        network_keys = self._network_keys
+        discovered = self.discovered_networks
+        for network in new_networks:
+            key = (network.ssid, network.bssid or '')
+            if key not in network_keys:
+                if len(discovered) == discovered.maxlen:
+                    # The deque is about to evict its oldest entry
+                    oldest = discovered[0]
+                    network_keys.discard((oldest.ssid, oldest.bssid or ''))
+                network_keys.add(key)
+                discovered.append(network)
 
     def _parse_nmcli_line_robust(self, line: str) -> Optional[dict]:
         """Robustly parse nmcli output line with proper BSSID handling"""
-        if not line.strip():
+        # One precompiled pattern validates and splits the whole line; fields
+        # arrive in NMCLI_WIFI_FIELDS order with the SSID last, so colons
+        # inside the SSID stay in the final group.
+        m = _NMCLI_LINE_RE.match(line)
+        if m is None:
             return None
 
-        # Split by colon, but be smart about BSSID
-        parts = line.split(':')
-
-        # We expect at least SSID:SECURITY:SIGNAL:FREQ:BSSID_PART1:...:BSSID_PART6:CHAN
-        # That's minimum 8 parts (SSID, SECURITY, SIGNAL, FREQ, 6 BSSID parts, CHAN)
-        if len(parts) < 8:
+        ssid = m.group('ssid')
+        if '\\' in ssid:
+            ssid = _NMCLI_UNESCAPE_RE.sub(r'\1', ssid)
+        ssid = ssid.strip()
+        if not ssid:  # Hidden network
             return None
 
-        try:
-            ssid = parts[0].strip()
-            security = parts[1].strip()
-            signal_str = parts[2].strip()
-            freq_str = parts[3].strip()
-
-            # Reconstruct BSSID from parts[4] to parts[9] (6 parts)
-            bssid_parts = parts[4:10]  # Take 6 parts for BSSID
-            bssid_raw = ':'.join(bssid_parts)
-
-            # Channel is the part after BSSID
-            channel_str = parts[10] if len(parts) > 10 else ""
-
-            # Validate and clean BSSID
-            bssid = self._validate_bssid(bssid_raw)
-
-            # Parse signal
-            signal = int(signal_str) if signal_str.isdigit() else 0
-
-            # Parse frequency
-            freq = self._parse_frequency(freq_str)
-
-            # Parse channel
-            channel = self._parse_channel(channel_str, freq)
-
-            return {
-                'ssid': ssid,
-                'security': security,
-                'signal': signal,
-                'frequency': freq,
-                'bssid': bssid,
-                'channel': channel
-            }
-
-        except (ValueError, IndexError) as e:
-            # Log parsing error for debugging
-            print(f"⚠️  Parsing error for line: {line[:50]}... - {e}")
-            return None
+        freq = self._parse_frequency(m.group('freq'))
+        channel_str = m.group('chan')
+
+        return {
+            'ssid': ssid,
+            'security': m.group('security').strip(),
+            'signal': int(m.group('signal')),
+            'frequency': freq,
+            'bssid': m.group('bssid').replace('\\', '').upper(),
+            'channel': int(channel_str) if channel_str else self._frequency_to_channel(freq)
+        }
 
     def _parse_frequency(self, freq_str: str) -> int:
         """Parse frequency string to MHz"""
@@ -362,42 +458,40 @@ class WiFiScanner:
         except ValueError:
             return 0
 
-    def _parse_channel(self, channel_str: str, frequency: int) -> Optional[int]:
-        """Parse channel number with frequency-based fallback"""
-        # Try direct parsing first
-        if channel_str and channel_str.isdigit():
-            return int(channel_str)
-
-        # Fallback: calculate channel from frequency
-        if frequency > 0:
-            return self._frequency_to_channel(frequency)
-
-        return None
-
     def _frequency_to_channel(self, frequency: int) -> Optional[int]:
         """Convert frequency to WiFi channel number"""
-        # 2.4GHz band channels
-        if 2412 <= frequency <= 2484:
-            if frequency == 2484:
-                return 14
-            else:
-                return (frequency - 2412) // 5 + 1
-
-        # 5GHz band channels (simplified mapping)
-        elif 5000 <= frequency <= 6000:
-            # Common 5GHz channels
-            freq_to_chan_5g = {
-                5180: 36, 5200: 40, 5220: 44, 5240: 48,
-                5260: 52, 5280: 56, 5300: 60, 5320: 64,
-                5500: 100, 5520: 104, 5540: 108, 5560: 112,
-                5580: 116, 5600: 120, 5620: 124, 5640: 128,
-                5660: 132, 5680: 136, 5700: 140, 5720: 144,
-                5745: 149, 5765: 153, 5785: 157, 5805: 161,
-                5825: 165
-            }
-            return freq_to_chan_5g.get(frequency)
-
-        return None
+        return _FREQ_TO_CHAN.get(frequency)
+
+    def export_networks_jsonl(self, path: Optional[str] = None, flush_every: int = 100) -> Path:
+        """Export discovered networks as JSON Lines (one network per line)
+
+        Networks are written one at a time, so memory use does not grow
+        with the session length and a partial file stays readable.
+        """
+        if path is None:
+            path = self.log_dir / f"networks_{datetime.now().strftime('%Y%m%d_%H%M%S')}.jsonl"
+        path = Path(path)
+
+        with open(path, 'w', encoding='utf-8') as f:
+            for count, network in enumerate(self.discovered_networks, 1):
+                record = asdict(network)
+                record['timestamp'] = network.timestamp_iso
+                f.write(_json_dumps_compact(record))
+                f.write('\n')
+                if count % flush_every == 0:
+                    f.flush()
+
+        return path
+
+    def _scan_statistics(self, networks: List[WiFiNetwork]) -> Tuple[List[WiFiNetwork], Counter]:
+        """Open networks and per-band counts, gathered in a single pass"""
+        band_counts = Counter()
+        open_networks = []
+        for network in networks:
+            band_counts[network.band] += 1
+            if network.is_open:
+                open_networks.append(network)
+        return open_networks, band_counts
 
     def continuous_scan(self):
         """Continuous scanning"""
@@ -416,18 +510,14 @@ class WiFiScanner:
                 print(f"Scan #{scan_count} - {datetime.now().strftime('%H:%M:%S')}")
                 print(f"{'='*50}")
 
-                networks = self.scan_networks()
-                open_networks = [n for n in networks if n.is_open]
-
-                band_24_simple = [n for n in networks if n.band == "2.4GHz"]
-                band_5_simple = [n for n in networks if n.band == "5GHz"]
-                band_6_simple = [n for n in networks if n.band == "6GHz"]
+                networks = self.scan_networks(force=True)
+                open_networks, band_counts = self._scan_statistics(networks)
 
                 print(f"📡 Total networks: {len(networks)}")
                 print(f"🔓 Open networks: {len(open_networks)}")
-                print(f"📡 2.4GHz: {len(band_24_simple)}")
-                print(f"⚡ 5GHz: {len(band_5_simple)}")
-                print(f"🚀 6GHz: {len(band_6_simple)}")
+                print(f"📡 2.4GHz: {band_counts['2.4GHz']}")
+                print(f"⚡ 5GHz: {band_counts['5GHz']}")
+                print(f"🚀 6GHz: {band_counts['6GHz']}")
 
                 if open_networks:
                     print("\n🎉 OPEN NETWORKS FOUND:")
@@ -437,111 +527,154 @@ class WiFiScanner:
                         bssid_display = f" | BSSID: {net.bssid}" if net.bssid else ""
                         print(f"  → \033[92m{net.ssid}\033[0m ({net.signal}%{rssi_display} {band_display}){bssid_display} \033[92m[OPEN]\033[0m")
 
-                print(f"\nWaiting {self.config.get('scan_interval')}s...")
-                time.sleep(self.config.get('scan_interval'))
+                scan_interval = self._current_interval()
+                print(f"\nWaiting {scan_interval}s...")
+                time.sleep(scan_interval)
 
         except KeyboardInterrupt:
             print("\n\nScanning terminated by user.")
 
+    def _new_scan_table(self, title: Optional[str] = None) -> Table:
+        """Empty scan table with its column definitions"""
+        table = Table(title=title)
+        table.add_column("SSID", style="cyan")
+        table.add_column("Security")
+        table.add_column("Signal", style="green")
+        table.add_column("Band", style="magenta")
+        table.add_column("BSSID", style="dim")
+        table.add_column("Quality", style="yellow")
+        return table
+
+    def _build_scan_widgets(self):
+        """Create the Rich panel and status line once; scans refill them"""
+        self._stats_panel = Panel("", title="📈 Overview", border_style="green")
+
+        self._status_line = Text()
+
+    def _post_scan_item(self, item) -> bool:
+        """Hand an item to the UI thread; gives up once scanning is stopped"""
+        while not self._scan_stop.is_set():
+            try:
+                self._scan_q.put(item, timeout=0.5)
+                return True
+            except queue.Full:
+                pass
+        return False
+
+    def _scan_worker(self):
+        """Scan repeatedly in a background thread and post the results"""
+        try:
+            while self._post_scan_item(None):
+                networks = self.scan_networks(force=True)
+                scan_interval = self._current_interval()
+                if not self._post_scan_item((networks, scan_interval)):
+                    break
+                self._scan_stop.wait(scan_interval)
+        except Exception as e:
+            # Hand the failure to the UI thread instead of dying silently
+            self._post_scan_item(e)
+
     def _continuous_scan_rich(self):
         """Advanced continuous scanning with rich"""
         scan_count = 0
 
-        try:
-            while True:
-                scan_count += 1
+        if self._stats_panel is None:
+            self._build_scan_widgets()
+        stats_panel = self._stats_panel
+        status_line = self._status_line
+
+        self._scan_stop.clear()
+        while not self._scan_q.empty():  # Leftovers from a previous run
+            self._scan_q.get_nowait()
+        threading.Thread(target=self._scan_worker, name="wss-scan", daemon=True).start()
 
-                # Scanning
-                with self.console.status("[bold green]Scanning WiFi networks..."):
-                    networks = self.scan_networks()
-
-                # Statistics
-                open_networks = [n for n in networks if n.is_open]
-                band_24 = [n for n in networks if n.band == "2.4GHz"]
-                band_5 = [n for n in networks if n.band == "5GHz"]
-                band_6 = [n for n in networks if n.band == "6GHz"]
-                unknown_bands = [n for n in networks if n.band.startswith("Unknown")]
-
-                # Create table
-                table = Table(title=f"WiFi Scan #{scan_count} - {datetime.now().strftime('%H:%M:%S')}")
-                table.add_column("SSID", style="cyan")
-                table.add_column("Security")
-                table.add_column("Signal", style="green")
-                table.add_column("Band", style="magenta")
-                table.add_column("BSSID", style="dim")
-                table.add_column("Quality", style="yellow")
-
-                # Sort by signal strength
-                networks_sorted = sorted(networks, key=lambda x: x.signal, reverse=True)
-
-                for network in networks_sorted[:15]:  # Show only top 15
-                    # Color coding for security
-                    if network.is_open:
-                        security_display = "[bold green]🔓 OPEN[/bold green]"
-                        ssid_style = "[bold green]"
-                        ssid_display = f"{ssid_style}{network.ssid}[/bold green]"
-                    else:
-                        security_display = f"[red]🔒 {network.security}[/red]"
-                        ssid_display = network.ssid
-
-                    # Enhanced signal display with RSSI
-                    if network.rssi:
-                        signal_display = f"{network.signal}% ({network.rssi}dBm)"
-                    else:
-                        signal_display = f"{network.signal}%"
-
-                    band_display = network.band if network.band else "Unknown"
-                    bssid_display = network.bssid if network.bssid else "N/A"
-
-                    table.add_row(
-                        ssid_display,
-                        security_display,
-                        signal_display,
-                        band_display,
-                        bssid_display,
-                        network.signal_quality
+        try:
+            # Redrawn only when something changes; no periodic refresh thread.
+            # A full table plus overview is taller than a 24-row terminal, so
+            # let it scroll instead of cutting off the bottom.
+            with Live(Group(self._new_scan_table(), stats_panel, status_line), console=self.console,
+                      auto_refresh=False, vertical_overflow="visible") as live:
+                while True:
+                    # Block until the worker reports progress; the UI stays
+                    # responsive while a scan is running
+                    item = self._scan_q.get()
+                    if item is None:
+                        status_line.plain = "⏳ Scanning WiFi networks..."
+                        status_line.style = "bold green"
+                        live.refresh()
+                        continue
+                    if isinstance(item, Exception):
+                        raise item
+
+                    networks, scan_interval = item
+                    scan_count += 1
+
+                    # Statistics
+                    open_networks, band_counts = self._scan_statistics(networks)
+                    unknown_count = band_counts['Unknown']
+
+                    # A fresh table per scan; building it is cheap next to rendering
+                    table = self._new_scan_table(
+                        f"WiFi Scan #{scan_count} - {datetime.now().strftime('%H:%M:%S')}"
                     )
 
-                # Statistics panel
-                stats_text = f"""
+                    # Top 15 by signal strength, without sorting the full list
+                    for network in heapq.nlargest(15, networks, key=_BY_SIGNAL):
+                        # Color coding for security
+                        if network.is_open:
+                            security_display = "[bold green]🔓 OPEN[/bold green]"
+                            ssid_style = "[bold green]"
+                            ssid_display = f"{ssid_style}{network.ssid}[/bold green]"
+                        else:
+                            security_display = f"[red]🔒 {network.security}[/red]"
+                            ssid_display = network.ssid
+
+                        # Enhanced signal display with RSSI
+                        if network.rssi:
+                            signal_display = f"{network.signal}% ({network.rssi}dBm)"
+                        else:
+                            signal_display = f"{network.signal}%"
+
+                        band_display = network.band if network.band else "Unknown"
+                        bssid_display = network.bssid if network.bssid else "N/A"
+
+                        table.add_row(
+                            ssid_display,
+                            security_display,
+                            signal_display,
+                            band_display,
+                            bssid_display,
+                            network.signal_quality
+                        )
+
+                    # Statistics panel
+                    stats_text = f"""
 📊 [bold]Statistics:[/bold]
   • Total networks: [bold blue]{len(networks)}[/bold blue]
   • 🔓 Open: [bold green]{len(open_networks)}[/bold green]
-  • 📡 2.4GHz: [bold cyan]{len(band_24)}[/bold cyan]
-  • ⚡ 5GHz: [bold magenta]{len(band_5)}[/bold magenta]
-  • 🚀 6GHz: [bold yellow]{len(band_6)}[/bold yellow]
+  • 📡 2.4GHz: [bold cyan]{band_counts['2.4GHz']}[/bold cyan]
+  • ⚡ 5GHz: [bold magenta]{band_counts['5GHz']}[/bold magenta]
+  • 🚀 6GHz: [bold yellow]{band_counts['6GHz']}[/bold yellow]
 """
 
-                if unknown_bands:
-                    stats_text += f"  • ❓ Unknown: [bold red]{len(unknown_bands)}[/bold red]\n"
+                    if unknown_count:
+                        stats_text += f"  • ❓ Unknown: [bold red]{unknown_count}[/bold red]\n"
 
-                if open_networks:
-                    stats_text += f"\n🎉 [bold yellow]FOUND {len(open_networks)} OPEN NETWORKS![/bold yellow]"
-
-                stats_panel = Panel(stats_text, title="📈 Overview", border_style="green")
-
-                # Display
-                self.console.clear()
-                self.console.print(table)
-                self.console.print(stats_panel)
-
-                # Progress bar countdown
-                scan_interval = self.config.get('scan_interval')
-                with Progress(
-                    SpinnerColumn(),
-                    TextColumn("[bold blue]Waiting for next scan..."),
-                    BarColumn(),
-                    TextColumn("[progress.percentage]{task.percentage:>3.0f}%"),
-                    TimeRemainingColumn(),
-                    console=self.console
-                ) as progress:
-                    task = progress.add_task("countdown", total=scan_interval)
-                    for _ in range(scan_interval):
-                        time.sleep(1)
-                        progress.update(task, advance=1)
+                    if open_networks:
+                        stats_text += f"\n🎉 [bold yellow]FOUND {len(open_networks)} OPEN NETWORKS![/bold yellow]"
+
+                    stats_panel.renderable = stats_text
+
+                    # The worker sleeps until the next scan
+                    next_scan = datetime.fromtimestamp(time.time() + scan_interval)
+                    status_line.plain = f"⏱️  Next scan at {next_scan.strftime('%H:%M:%S')} ({scan_interval}s)"
+                    status_line.style = "bold blue"
+                    live.update(Group(table, stats_panel, status_line), refresh=True)
 
         except KeyboardInterrupt:
             self.console.print("\n\n[yellow]Scanning terminated by user.[/yellow]")
+        finally:
+            self._scan_stop.set()
 
     def auto_connect(self):
         """Automatic connection to open networks"""
@@ -561,7 +694,7 @@ class WiFiScanner:
             return
 
         # Sort by signal strength
-        open_networks.sort(key=lambda x: x.signal, reverse=True)
+        open_networks.sort(key=_BY_SIGNAL, reverse=True)
 
         if RICH_AVAILABLE:
             self.console.print(f"[green]🔍 Found {len(open_networks)} open networks[/green]")
@@ -604,7 +737,17 @@ class WiFiScannerApp:
 
     def run_continuous_scan(self):
         """Run continuous scanning"""
-        return self.scanner.continuous_scan()
+        try:
+            return self.scanner.continuous_scan()
+        finally:
+            self.export_session()
+
+    def export_session(self):
+        """Export the scanned networks when export_format is "jsonl" """
+        if self.config.get('export_format') != 'jsonl' or not self.scanner.discovered_networks:
+            return
+        path = self.scanner.export_networks_jsonl()
+        print(f"💾 Networks exported to {path}")
 
     def run_auto_connect(self):
         """Run auto-connect"""
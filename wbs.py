@@ -16,35 +16,81 @@ import sys
 import os
 import time
 import argparse
-from pathlib import Path
-
-# Add modules directory to path
-sys.path.insert(0, str(Path(__file__).parent / "modules"))
-
-try:
-    from rich.console import Console
-    from rich.panel import Panel
-    from rich.prompt import Prompt
-    from rich.table import Table
-    from rich import box
-    RICH_AVAILABLE = True
-except ImportError:
-    RICH_AVAILABLE = False
-    print("⚠️  For better appearance install rich: pip install rich")
-
-# Import our modules
-try:
-    from modules.pytag_module import run_pytag, check_bluetooth_permissions
-    from modules.wss_module import run_wss_continuous, run_wss_autoconnect, run_wss_statistics
-    MODULES_AVAILABLE = True
-except ImportError as e:
-    print(f"❌ Error importing modules: {e}")
-    MODULES_AVAILABLE = False
+import functools
+import shutil
+import importlib
+from collections import namedtuple
 
+# Pauses before the banner and before each tool starts are opt-in
+_DRAMATIC = os.environ.get("WBS_DRAMATIC") == "1"
+# Force the plain text interface even when rich is installed
+_PLAIN_UI = os.environ.get("WBS_PLAIN") == "1"
 
-def show_main_banner():
-    """Display main application banner"""
-    banner = """
+# Rich and the security modules are imported on first use, so --help,
+# --version and menu paths that never start a tool skip their import cost
+_RichUI = namedtuple("_RichUI", "Console Panel Prompt Table box")
+
+
+@functools.lru_cache(maxsize=1)
+def _get_rich():
+    """Import the Rich UI classes; None when rich is not installed"""
+    try:
+        from rich.console import Console
+        from rich.panel import Panel
+        from rich.prompt import Prompt
+        from rich.table import Table
+        from rich import box
+    except ImportError:
+        print("⚠️  For better appearance install rich: pip install rich")
+        return None
+    return _RichUI(Console, Panel, Prompt, Table, box)
+
+
+@functools.lru_cache(maxsize=1)
+def _console():
+    """Shared Rich console; terminal capabilities are probed only once"""
+    return _get_rich().Console()
+
+
+def _import_module(name):
+    """Import one of our modules; None (with a message) on failure"""
+    try:
+        return importlib.import_module(name)
+    except ImportError as e:
+        print(f"❌ Error importing modules: {e}")
+        return None
+
+
+@functools.lru_cache(maxsize=1)
+def _get_pytag():
+    """PyTAG module, imported on first use"""
+    return _import_module("modules.pytag_module")
+
+
+@functools.lru_cache(maxsize=1)
+def _get_wss():
+    """WSS module, imported on first use"""
+    return _import_module("modules.wss_module")
+
+
+def _probe_system_deps(deps):
+    """Map each command in deps to whether it is found on PATH"""
+    return {cmd: shutil.which(cmd) is not None for cmd in deps}
+
+
+@functools.lru_cache(maxsize=1)
+def _os_info():
+    """(system, machine) of the host; fixed for the lifetime of the process"""
+    import platform
+    return platform.system(), platform.machine()
+
+
+def _modules_available():
+    """True when both security modules can be imported"""
+    return _get_pytag() is not None and _get_wss() is not None
+
+
+_MAIN_BANNER = """
 ╔══════════════════════════════════════════════════════════════════════════════╗
 ║                                                                              ║
 ║  ██╗    ██╗██████╗ ███████╗                                                 ║
@@ -65,12 +111,10 @@ def show_main_banner():
 ║                                                                              ║
 ╚══════════════════════════════════════════════════════════════════════════════╝
     """
-    return banner
 
+_MAIN_BANNER_RICH = f"[bold green]{_MAIN_BANNER}[/bold green]"
 
-def show_simple_banner():
-    """Display simple banner for terminals without rich"""
-    banner = """
+_SIMPLE_BANNER = """
 ================================================================================
 
   ██╗    ██╗██████╗ ███████╗
@@ -89,32 +133,19 @@ def show_simple_banner():
 
 ================================================================================
     """
-    return banner
 
 
-class UnifiedSecurityApp:
-    """Main unified security application"""
-    
-    def __init__(self):
-        self.console = Console() if RICH_AVAILABLE else None
-        self.running = True
-        
-    def show_banner(self):
-        """Display application banner"""
-        if RICH_AVAILABLE:
-            banner = show_main_banner()
-            self.console.print(f"[bold green]{banner}[/bold green]")
-        else:
-            banner = show_simple_banner()
-            print(banner)
-        
-        # Add a small pause for dramatic effect
-        time.sleep(1)
-    
-    def show_main_menu(self):
-        """Display main menu"""
-        if RICH_AVAILABLE:
-            menu_text = """
+def show_main_banner():
+    """Display main application banner"""
+    return _MAIN_BANNER
+
+
+def show_simple_banner():
+    """Display simple banner for terminals without rich"""
+    return _SIMPLE_BANNER
+
+
+_MENU_TEXT = """
 [bold cyan]PyTAG - AirTag Detector:[/bold cyan]
   [bold yellow]1.[/bold yellow] 🏷️  Run PyTAG (Rich UI)
   [bold yellow]2.[/bold yellow] 🏷️  Run PyTAG (Simple mode)
@@ -129,69 +160,136 @@ class UnifiedSecurityApp:
   [bold yellow]7.[/bold yellow] ⚙️  Check dependencies
   [bold yellow]q.[/bold yellow] ❌ Exit application
 """
-            panel = Panel(
-                menu_text,
-                title="🛡️  WBS - WiFi Bluetooth Suite",
-                border_style="blue",
-                box=box.ROUNDED
-            )
-            self.console.print(panel)
-        else:
-            print("\n" + "="*80)
-            print("🛡️  WBS - WiFi Bluetooth Suite")
-            print("="*80)
-            print("\nPyTAG - AirTag Detector:")
-            print("  1. 🏷️  Run PyTAG (Rich UI)")
-            print("  2. 🏷️  Run PyTAG (Simple mode)")
-            print("\nWSS - WiFi Scanner Suite:")
-            print("  3. 📡 Continuous WiFi scanning")
-            print("  4. 🔄 Auto-connect to open networks")
-            print("  5. 📊 Show WiFi statistics")
-            print("\nSystem:")
-            print("  6. ℹ️  Show system information")
-            print("  7. ⚙️  Check dependencies")
-            print("  q. ❌ Exit application")
+
+
+def _show_banner_rich(app):
+    app.console.print(_MAIN_BANNER_RICH)
+
+
+def _show_banner_plain(app):
+    print(_SIMPLE_BANNER)
+
+
+def _show_menu_rich(app):
+    console = app.console
+    console.clear()
+
+    width = console.width
+    if app._menu_render is None or app._menu_render[0] != width:
+        # Render the panel once per terminal width and reuse the output
+        Panel, box = app._rich.Panel, app._rich.box
+        panel = Panel(
+            _MENU_TEXT,
+            title="🛡️  WBS - WiFi Bluetooth Suite",
+            border_style="blue",
+            box=box.ROUNDED
+        )
+        with console.capture() as capture:
+            console.print(panel)
+        app._menu_render = (width, capture.get())
+    console.file.write(app._menu_render[1])
+    console.file.flush()
+
+
+def _show_menu_plain(app):
+    print("\n" + "="*80)
+    print("🛡️  WBS - WiFi Bluetooth Suite")
+    print("="*80)
+    print("\nPyTAG - AirTag Detector:")
+    print("  1. 🏷️  Run PyTAG (Rich UI)")
+    print("  2. 🏷️  Run PyTAG (Simple mode)")
+    print("\nWSS - WiFi Scanner Suite:")
+    print("  3. 📡 Continuous WiFi scanning")
+    print("  4. 🔄 Auto-connect to open networks")
+    print("  5. 📊 Show WiFi statistics")
+    print("\nSystem:")
+    print("  6. ℹ️  Show system information")
+    print("  7. ⚙️  Check dependencies")
+    print("  q. ❌ Exit application")
+
+
+def _read_choice_rich(app):
+    return app._rich.Prompt.ask("\n[bold yellow]Select option[/bold yellow]", default="1")
+
+
+def _read_choice_plain(app):
+    return input("\nSelect option (1-7, q): ").strip()
+
+
+def _show_system_info_rich(app):
+    table = app._rich.Table(title="🖥️  System Information")
+    table.add_column("Component", style="cyan")
+    table.add_column("Status", style="green")
+    table.add_column("Details", style="yellow")
+    
+    # Python version
+    python_version = f"{sys.version_info.major}.{sys.version_info.minor}.{sys.version_info.micro}"
+    table.add_row("Python", "✅ Available", python_version)
+    
+    # Rich library
+    table.add_row("Rich UI", "✅ Available", "Enhanced interface enabled")
+    
+    # Modules
+    if _modules_available():
+        table.add_row("Security Modules", "✅ Available", "PyTAG + WSS loaded")
+    else:
+        table.add_row("Security Modules", "❌ Error", "Module import failed")
+    
+    # Operating System
+    os_name, os_arch = _os_info()
+    table.add_row("Operating System", "ℹ️  Info", os_name)
+    table.add_row("Architecture", "ℹ️  Info", os_arch)
+    
+    app.console.print(table)
+
+
+def _show_system_info_plain(app):
+    print("\n🖥️  System Information:")
+    print("="*50)
+    python_version = f"{sys.version_info.major}.{sys.version_info.minor}.{sys.version_info.micro}"
+    print(f"Python: ✅ {python_version}")
+    print(f"Rich UI: {'✅ Available' if _get_rich() else '❌ Missing (pip install rich)'}")
+    print(f"Modules: {'✅ Available' if _modules_available() else '❌ Error'}")
+    
+    os_name, os_arch = _os_info()
+    print(f"OS: {os_name} {os_arch}")
+
+
+# (banner, menu, choice prompt, system info) for each interface; the
+# app picks one set at start-up instead of branching on every call
+_UIRenderers = namedtuple("_UIRenderers", "banner menu read_choice system_info")
+_RICH_RENDERERS = _UIRenderers(_show_banner_rich, _show_menu_rich,
+                               _read_choice_rich, _show_system_info_rich)
+_PLAIN_RENDERERS = _UIRenderers(_show_banner_plain, _show_menu_plain,
+                                _read_choice_plain, _show_system_info_plain)
+
+
+class UnifiedSecurityApp:
+    """Main unified security application"""
+    
+    def __init__(self):
+        self._rich = None if _PLAIN_UI else _get_rich()
+        self.console = _console() if self._rich else None
+        self._ui = _RICH_RENDERERS if self._rich else _PLAIN_RENDERERS
+        self.running = True
+        # (console width, rendered menu panel) for the Rich menu
+        self._menu_render = None
+        
+    def show_banner(self):
+        """Display application banner"""
+        self._ui.banner(self)
+        
+        # Add a small pause for dramatic effect
+        if _DRAMATIC:
+            time.sleep(1)
+    
+    def show_main_menu(self):
+        """Display main menu"""
+        self._ui.menu(self)
     
     def show_system_info(self):
         """Show system information"""
-        if RICH_AVAILABLE:
-            table = Table(title="🖥️  System Information")
-            table.add_column("Component", style="cyan")
-            table.add_column("Status", style="green")
-            table.add_column("Details", style="yellow")
-            
-            # Python version
-            python_version = f"{sys.version_info.major}.{sys.version_info.minor}.{sys.version_info.micro}"
-            table.add_row("Python", "✅ Available", python_version)
-            
-            # Rich library
-            if RICH_AVAILABLE:
-                table.add_row("Rich UI", "✅ Available", "Enhanced interface enabled")
-            else:
-                table.add_row("Rich UI", "❌ Missing", "pip install rich")
-            
-            # Modules
-            if MODULES_AVAILABLE:
-                table.add_row("Security Modules", "✅ Available", "PyTAG + WSS loaded")
-            else:
-                table.add_row("Security Modules", "❌ Error", "Module import failed")
-            
-            # Operating System
-            import platform
-            table.add_row("Operating System", "ℹ️  Info", platform.system())
-            table.add_row("Architecture", "ℹ️  Info", platform.machine())
-            
-            self.console.print(table)
-        else:
-            print("\n🖥️  System Information:")
-            print("="*50)
-            python_version = f"{sys.version_info.major}.{sys.version_info.minor}.{sys.version_info.micro}"
-            print(f"Python: ✅ {python_version}")
-            print(f"Rich UI: {'✅ Available' if RICH_AVAILABLE else '❌ Missing (pip install rich)'}")
-            print(f"Modules: {'✅ Available' if MODULES_AVAILABLE else '❌ Error'}")
-            
-            import platform
-            print(f"OS: {platform.system()} {platform.machine()}")
+        self._ui.system_info(self)
     
     def check_dependencies(self):
         """Check system dependencies"""
@@ -200,8 +298,8 @@ class UnifiedSecurityApp:
         
         # Python dependencies
         deps = {
-            "rich": RICH_AVAILABLE,
-            "modules": MODULES_AVAILABLE
+            "rich": _get_rich() is not None,
+            "modules": _modules_available()
         }
         
         for dep, available in deps.items():
@@ -209,16 +307,12 @@ class UnifiedSecurityApp:
             print(f"{dep:20} {status}")
         
         # System commands for WSS
-        system_deps = ['nmcli', 'ping', 'iwconfig', 'bluetoothctl']
+        system_deps = ('nmcli', 'ping', 'iwconfig', 'bluetoothctl')
         print(f"\nSystem commands:")
+        found = _probe_system_deps(system_deps)
         for cmd in system_deps:
-            try:
-                import subprocess
-                result = subprocess.run(f"which {cmd}", shell=True, capture_output=True)
-                status = "✅ OK" if result.returncode == 0 else "❌ Missing"
-                print(f"{cmd:20} {status}")
-            except:
-                print(f"{cmd:20} ❌ Error checking")
+            status = "✅ OK" if found[cmd] else "❌ Missing"
+            print(f"{cmd:20} {status}")
         
         # Bluetooth permissions
         print(f"\nBluetooth permissions:")
@@ -230,16 +324,18 @@ class UnifiedSecurityApp:
     
     def run_pytag_rich(self):
         """Run PyTAG with Rich UI"""
-        if not MODULES_AVAILABLE:
+        pytag = _get_pytag()
+        if pytag is None:
             print("❌ PyTAG module not available")
             return
         
         print("\n🏷️  Starting PyTAG - AirTag Detector (Rich UI)")
         print("💡 Press Ctrl+C to return to main menu\n")
-        time.sleep(2)
+        if _DRAMATIC:
+            time.sleep(2)
         
         try:
-            run_pytag(simple_mode=False)
+            pytag.run_pytag(simple_mode=False)
         except KeyboardInterrupt:
             print("\n🔙 Returning to main menu...")
         except Exception as e:
@@ -247,16 +343,18 @@ class UnifiedSecurityApp:
     
     def run_pytag_simple(self):
         """Run PyTAG in simple mode"""
-        if not MODULES_AVAILABLE:
+        pytag = _get_pytag()
+        if pytag is None:
             print("❌ PyTAG module not available")
             return
         
         print("\n🏷️  Starting PyTAG - AirTag Detector (Simple mode)")
         print("💡 Press Ctrl+C to return to main menu\n")
-        time.sleep(2)
+        if _DRAMATIC:
+            time.sleep(2)
         
         try:
-            run_pytag(simple_mode=True)
+            pytag.run_pytag(simple_mode=True)
         except KeyboardInterrupt:
             print("\n🔙 Returning to main menu...")
         except Exception as e:
@@ -264,16 +362,18 @@ class UnifiedSecurityApp:
     
     def run_wss_continuous(self):
         """Run WSS continuous scanning"""
-        if not MODULES_AVAILABLE:
+        wss = _get_wss()
+        if wss is None:
             print("❌ WSS module not available")
             return
         
         print("\n📡 Starting WSS - WiFi Scanner Suite (Continuous)")
         print("💡 Press Ctrl+C to return to main menu\n")
-        time.sleep(2)
+        if _DRAMATIC:
+            time.sleep(2)
         
         try:
-            run_wss_continuous()
+            wss.run_wss_continuous()
         except KeyboardInterrupt:
             print("\n🔙 Returning to main menu...")
         except Exception as e:
@@ -281,16 +381,18 @@ class UnifiedSecurityApp:
     
     def run_wss_autoconnect(self):
         """Run WSS auto-connect"""
-        if not MODULES_AVAILABLE:
+        wss = _get_wss()
+        if wss is None:
             print("❌ WSS module not available")
             return
         
         print("\n🔄 Starting WSS - Auto-connect to open networks")
         print("💡 Press Ctrl+C to return to main menu\n")
-        time.sleep(2)
+        if _DRAMATIC:
+            time.sleep(2)
         
         try:
-            run_wss_autoconnect()
+            wss.run_wss_autoconnect()
         except KeyboardInterrupt:
             print("\n🔙 Returning to main menu...")
         except Exception as e:
@@ -298,7 +400,8 @@ class UnifiedSecurityApp:
     
     def run_wss_statistics(self):
         """Show WSS statistics"""
-        if not MODULES_AVAILABLE:
+        wss = _get_wss()
+        if wss is None:
             print("❌ WSS module not available")
             return
         
@@ -306,7 +409,7 @@ class UnifiedSecurityApp:
         print("="*30)
         
         try:
-            run_wss_statistics()
+            wss.run_wss_statistics()
         except Exception as e:
             print(f"❌ Error showing WSS statistics: {e}")
     
@@ -315,22 +418,10 @@ class UnifiedSecurityApp:
         # Show banner
         self.show_banner()
         
-        if not MODULES_AVAILABLE:
-            print("❌ Critical error: Security modules not available")
-            print("💡 Please check the modules directory and dependencies")
-            return
-        
         while self.running:
             try:
-                if RICH_AVAILABLE:
-                    self.console.clear()
-                
                 self.show_main_menu()
-                
-                if RICH_AVAILABLE:
-                    choice = Prompt.ask("\n[bold yellow]Select option[/bold yellow]", default="1")
-                else:
-                    choice = input("\nSelect option (1-7, q): ").strip()
+                choice = self._ui.read_choice(self)
                 
                 if choice == "1":
                     self.run_pytag_rich()
@@ -353,22 +444,30 @@ class UnifiedSecurityApp:
                     print("❌ Invalid choice. Please select 1-7 or 'q'")
                 
                 if choice != "q" and self.running:
-                    input("\nPress Enter to continue...")
+                    self._pause("\nPress Enter to continue...")
                     
-            except KeyboardInterrupt:
-                print("\n\n👋 Application terminated by user")
-                self.running = False
+            except (KeyboardInterrupt, EOFError):
+                self._terminate()
             except Exception as e:
                 print(f"\n❌ Unexpected error: {e}")
-                input("Press Enter to continue...")
+                self._pause("Press Enter to continue...")
 
+    def _terminate(self):
+        """Leave the main loop after Ctrl+C or end of input"""
+        print("\n\n👋 Application terminated by user")
+        self.running = False
 
-def main():
-    """Main entry point"""
-    parser = argparse.ArgumentParser(
-        description="WBS - WiFi Bluetooth Suite | Unified Security Tools Suite",
-        formatter_class=argparse.RawDescriptionHelpFormatter,
-        epilog="""
+    def _pause(self, prompt):
+        """Wait for Enter; Ctrl+C or end of input ends the application"""
+        try:
+            input(prompt)
+        except (KeyboardInterrupt, EOFError):
+            self._terminate()
+
+
+_DESCRIPTION = "WBS - WiFi Bluetooth Suite | Unified Security Tools Suite"
+
+_EPILOG = """
 Examples:
   python3 wbs.py                    # Run interactive menu
   python3 wbs.py --pytag            # Run PyTAG directly
@@ -379,6 +478,15 @@ Components:
   PyTAG - Apple AirTag detector using BLE scanning
   WSS   - WiFi Scanner Suite for network analysis
         """
+
+
+@functools.lru_cache(maxsize=1)
+def _build_parser():
+    """Command line parser, built once per process"""
+    parser = argparse.ArgumentParser(
+        description=_DESCRIPTION,
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog=_EPILOG
     )
     
     parser.add_argument(
@@ -405,25 +513,32 @@ Components:
         version="Unified Security Tools Suite 1.0.0"
     )
     
-    args = parser.parse_args()
+    return parser
+
+
+def main():
+    """Main entry point"""
+    args = _build_parser().parse_args()
     
     # Direct execution modes
     if args.pytag:
-        if not MODULES_AVAILABLE:
+        pytag = _get_pytag()
+        if pytag is None:
             print("❌ PyTAG module not available")
             sys.exit(1)
         try:
-            run_pytag(simple_mode=args.simple)
+            pytag.run_pytag(simple_mode=args.simple)
         except KeyboardInterrupt:
             print("\n👋 PyTAG stopped!")
         sys.exit(0)
     
     if args.wss:
-        if not MODULES_AVAILABLE:
+        wss = _get_wss()
+        if wss is None:
             print("❌ WSS module not available")
             sys.exit(1)
         try:
-            run_wss_continuous()
+            wss.run_wss_continuous()
         except KeyboardInterrupt:
             print("\n👋 WSS stopped!")
         sys.exit(0)